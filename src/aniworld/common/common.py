@@ -43,7 +43,10 @@ PACKAGE_MANAGERS = {
 
 
 def _make_request(
-    url: str, timeout: int = DEFAULT_REQUEST_TIMEOUT, headers: Optional[Dict] = None
+    url: str,
+    timeout: int = DEFAULT_REQUEST_TIMEOUT,
+    headers: Optional[Dict] = None,
+    session: Optional[requests.Session] = None,
 ) -> requests.Response:
     """Make HTTP request with error handling and default headers."""
     try:
@@ -52,7 +55,7 @@ def _make_request(
             request_headers.update(headers)
 
         # Allow redirects for s.to which might redirect from /stream/ to /serie/
-        response = requests.get(
+        response = (session or requests).get(
             url, timeout=timeout, headers=request_headers, allow_redirects=True
         )
         response.raise_for_status()
@@ -668,13 +671,16 @@ def _parse_season_episodes_details(soup: BeautifulSoup, season: int) -> List[Dic
     return sorted(episodes, key=lambda x: x["episode"])
 
 
-def get_season_episodes_details(slug: str, link: str = ANIWORLD_TO) -> Dict[int, List[Dict]]:
+def get_season_episodes_details(
+    slug: str, link: str = ANIWORLD_TO, session: Optional[requests.Session] = None
+) -> Dict[int, List[Dict]]:
     """
     Get detailed episode info (including languages) for each season.
 
     Args:
         slug: Anime slug from URL
         link: Base Url
+        session: Optional requests session to reuse connections across calls
 
     Returns:
         Dictionary mapping season numbers to list of episode details
@@ -714,7 +720,7 @@ def get_season_episodes_details(slug: str, link: str = ANIWORLD_TO) -> Dict[int,
                 # s.to uses /serie/SLUG structure now
                 base_url = f"{S_TO}/serie/{clean_slug}"
 
-        response = _make_request(base_url)
+        response = _make_request(base_url, session=session)
         # Use final URL after redirects for subsequent requests
         final_url = response.url.rstrip("/")
         soup = BeautifulSoup(response.content, "html.parser")
@@ -738,7 +744,7 @@ def get_season_episodes_details(slug: str, link: str = ANIWORLD_TO) -> Dict[int,
         for season in range(1, number_of_seasons + 1):
             season_url = f"{final_url}/staffel-{season}"
             try:
-                season_response = _make_request(season_url)
+                season_response = _make_request(season_url, session=session)
                 season_soup = BeautifulSoup(season_response.content, "html.parser")
                 all_episodes[season] = _parse_season_episodes_details(season_soup, season)
             except Exception as err:
@@ -644,25 +644,29 @@ class Episode:
             requests.RequestException: If HTTP request fails
         """
         if self._html_cache is None:
-            if not self.link:
-                raise ValueError("Cannot fetch HTML without episode link")
-
-            try:
-                headers = DEFAULT_HEADERS.copy()
-                self._html_cache = requests.get(
-                    self.link,
-                    timeout=DEFAULT_REQUEST_TIMEOUT,
-                    headers=headers,
-                )
-                self._html_cache.raise_for_status()
-            except requests.RequestException as err:
-                logging.error(
-                    "Failed to fetch episode HTML for link '%s': %s", self.link, err
-                )
-                raise
+            self._fetch_html()
 
         return self._html_cache
 
+    def _fetch_html(self, session: Optional[requests.Session] = None) -> None:
+        """Fetch the episode page into the HTML cache, optionally over a shared session."""
+        if not self.link:
+            raise ValueError("Cannot fetch HTML without episode link")
+
+        try:
+            headers = DEFAULT_HEADERS.copy()
+            self._html_cache = (session or requests).get(
+                self.link,
+                timeout=DEFAULT_REQUEST_TIMEOUT,
+                headers=headers,
+            )
+            self._html_cache.raise_for_status()
+        except requests.RequestException as err:
+            logging.error(
+                "Failed to fetch episode HTML for link '%s': %s", self.link, err
+            )
+            raise
+
     def _get_episode_titles_from_html(self) -> Tuple[str, str]:
         """
         Extract episode titles from HTML.
@@ -1610,10 +1614,13 @@ class Episode:
             logging.error("Critical error in _auto_fill_basic_details: %s", err)
             self._basic_details_filled = True
 
-    def auto_fill_details(self) -> None:
+    def auto_fill_details(self, session: Optional[requests.Session] = None) -> None:
         """
         Automatically fill episode details from available information.
         This is now called lazily only when needed.
+
+        Args:
+            session: Optional requests session used to fetch the episode page
         """
         if self._full_details_filled:
             return
@@ -1625,6 +1632,9 @@ class Episode:
             # Fetch and populate metadata if link is available (expensive operations)
             if self.link:
                 try:
+                    if session is not None and self._html_cache is None:
+                        self._fetch_html(session)
+
                     # Get anime title if missing
                     if not self.anime_title:
                         self.anime_title = get_anime_title_from_html(
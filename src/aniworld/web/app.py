@@ -794,7 +794,7 @@ class WebApp:
                 from flask import request
 
                 data = request.get_json()
-                logging.info(f"[DEBUG] Received download request: {data}")
+                logging.debug("Received download request: %s", data)
 
                 # Check for both single episode (legacy) and multiple episodes (new)
                 episode_urls = data.get("episode_urls", [])
@@ -1433,10 +1433,8 @@ class WebApp:
                     for t in trackers:
                         t_id = t["id"]
                         t["is_scanning"] = self.download_manager._tracker_scan_status.get(t_id, False)
-                        t["debug_messages"] = self.download_manager._tracker_debug_messages.get(t_id, [])
-                        if t_id in self.download_manager._tracker_debug_messages:
-                            # Clear messages after sending to avoid duplicates
-                            self.download_manager._tracker_debug_messages[t_id] = []
+                        # Pop messages when sending them to avoid duplicates
+                        t["debug_messages"] = list(self.download_manager._tracker_debug_messages.pop(t_id, ()))
                     return jsonify({"success": True, "trackers": trackers})
 
                 if not self.db:
@@ -1450,9 +1448,7 @@ class WebApp:
                         for t in trackers:
                             t_id = t["id"]
                             t["is_scanning"] = self.download_manager._tracker_scan_status.get(t_id, False)
-                            t["debug_messages"] = self.download_manager._tracker_debug_messages.get(t_id, [])
-                            if t_id in self.download_manager._tracker_debug_messages:
-                                self.download_manager._tracker_debug_messages[t_id] = []
+                            t["debug_messages"] = list(self.download_manager._tracker_debug_messages.pop(t_id, ()))
                         return jsonify({"success": True, "trackers": trackers})
                     return jsonify({"success": False, "error": "Unauthorized"}), 401
 
@@ -1464,9 +1460,7 @@ class WebApp:
                 for t in trackers:
                     t_id = t["id"]
                     t["is_scanning"] = self.download_manager._tracker_scan_status.get(t_id, False)
-                    t["debug_messages"] = self.download_manager._tracker_debug_messages.get(t_id, [])
-                    if t_id in self.download_manager._tracker_debug_messages:
-                        self.download_manager._tracker_debug_messages[t_id] = []
+                    t["debug_messages"] = list(self.download_manager._tracker_debug_messages.pop(t_id, ()))
                 return jsonify({"success": True, "trackers": trackers})
             except Exception as e:
                 logging.error(f"Failed to get trackers: {e}")
@@ -7,10 +7,158 @@ import threading
 import time
 import logging
 import re
-from typing import Optional
-from datetime import datetime
+import sys
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from enum import IntEnum
+from functools import lru_cache
+from itertools import count
+from typing import Dict, Optional
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+try:
+    from fastrlock.rlock import FastRLock  # optional C implementation
+except ImportError:
+    from threading import RLock as FastRLock
 from .database import UserDatabase
+from ..config import DEFAULT_HEADERS
 from ..movie4k.movie4k_stream_finder import detect_provider, hole_sprachliste, hole_stream_daten
+# Bound once here instead of importing per episode; movie4k_stream_finder already pulls both modules in
+from ..action.download import download as _run_download
+from ..parser import arguments as _yt_arguments
+
+logger = logging.getLogger(__name__)
+
+# Interned so comparisons against statuses built at runtime hit the identity fast path
+STATUS_QUEUED = sys.intern("queued")
+STATUS_DOWNLOADING = sys.intern("downloading")
+STATUS_COMPLETED = sys.intern("completed")
+STATUS_FAILED = sys.intern("failed")
+STATUS_CANCELLED = sys.intern("cancelled")
+
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_SEASON_EP_RE = re.compile(r"staffel-(\d+)/episode-(\d+)")
+
+_PROGRESS_INTERVAL = 0.2  # seconds; the UI polls at 1-2 Hz, so faster yt-dlp ticks are dropped
+_TRACKER_SCAN_WORKERS = 4
+_VERIFY_WORKERS = 8
+_MAX_TRACKER_DEBUG_MESSAGES = 200
+_STREAM_PROBE_WORKERS = 8
+_STREAM_PROBE_TIMEOUT = 5
+_MAX_REQUESTS_PER_HOST = 2
+
+# Verified episode-page language names accepted per tracker language:
+# (substrings selecting the branch from the tracker language, exact names, substrings)
+_LANG_MATCHERS = (
+    (("german dub", "de dub", "deutsch"), frozenset({"deutsch", "de"}), ("de dub", "german dub", "synchronisation")),
+    (("german sub", "de sub"), frozenset(), ("de sub", "german sub", "untertitel")),
+    (("english sub", "en sub"), frozenset({"englisch", "en"}), ("en sub", "english sub")),
+    (("english dub", "en dub"), frozenset({"englisch", "en"}), ("en dub", "english dub")),
+)
+
+
+def _consume_flag(flags: set, key) -> bool:
+    """Remove key from a lock-free flag set; True only for the caller whose remove() succeeded"""
+    if key not in flags: return False  # common case, no exception
+    try:
+        flags.remove(key)
+        return True
+    except KeyError:
+        return False
+
+
+def _strip_ansi(s: str) -> str:
+    """Remove colour codes; yt-dlp only adds them on a tty, so skip the regex when there is nothing to strip"""
+    return _ANSI_RE.sub("", s) if "\x1b" in s else s
+
+
+def _normalize_scheme(u: str) -> str:
+    """Give scheme-relative or bare hoster links an https scheme"""
+    if u.startswith(("http://", "https://")): return u
+    return "https:" + u if u.startswith("//") else "https://" + u
+
+
+@lru_cache(maxsize=4096)
+def _ep_url(base_url: str, stream_path: str, slug: str, season: int, episode: int) -> str:
+    """Episode page URL; cached because every scan regenerates the same URLs"""
+    return f"{base_url}/{stream_path}/{slug}/staffel-{season}/episode-{episode}"
+
+
+class UpdateResult(IntEnum):
+    """Outcome of a job status/progress update (OK is 0, so test with != UpdateResult.OK)"""
+    OK = 0
+    NOT_FOUND = 1
+    INVALID_TRANSITION = 2
+
+
+class EpisodeState:
+    """Per-episode state of a download job"""
+
+    __slots__ = ("url", "name", "status", "progress", "speed", "eta")
+
+    def __init__(self, url: str, name: str):
+        self.url = url
+        self.name = name
+        self.status = STATUS_QUEUED
+        self.progress = 0.0
+        self.speed = ""
+        self.eta = ""
+
+    def to_dict(self) -> dict:
+        return {"url": self.url, "name": self.name, "status": self.status, "progress": self.progress, "speed": self.speed, "eta": self.eta}
+
+
+class DownloadEntry:
+    """In-memory state of a single download job"""
+
+    __slots__ = (
+        "id", "anime_title", "episode_urls", "episodes", "episodes_by_url", "language", "provider",
+        "is_movie", "episodes_config", "total_episodes", "completed_episodes",
+        "status", "current_episode", "progress_percentage", "current_episode_progress",
+        "error_message", "created_by", "created_at", "started_at", "completed_at",
+        "lock", "_inv_total_x100",
+    )
+
+    def __init__(self, queue_id: int, anime_title: str, episode_urls: list, episodes: list, language: str, provider: str, is_movie: bool = False, episodes_config: Optional[dict] = None, total_episodes: int = 0, created_by: Optional[int] = None):
+        self.id = queue_id
+        self.anime_title = anime_title
+        self.episode_urls = episode_urls
+        self.episodes = episodes
+        self.episodes_by_url = {e.url: e for e in episodes}  # same EpisodeState objects, indexed for O(1) lookups
+        self.language = language
+        self.provider = provider
+        self.is_movie = is_movie
+        self.episodes_config = episodes_config
+        self.set_total_episodes(total_episodes)
+        self.completed_episodes = 0
+        self.status = STATUS_QUEUED
+        self.current_episode = ""
+        self.progress_percentage = 0.0
+        self.current_episode_progress = 0.0
+        self.error_message = ""
+        self.created_by = created_by
+        self.created_at: float = time.monotonic()
+        self.started_at: Optional[float] = None  # time.monotonic()
+        self.completed_at: Optional[float] = None  # time.monotonic()
+        self.lock = threading.Lock()  # guards this job's fields; never take _queue_lock while holding it
+
+    def set_total_episodes(self, total: int):
+        """Set total_episodes along with the 100/total factor the progress paths multiply by"""
+        self.total_episodes = total
+        self._inv_total_x100 = 100.0 / total if total > 0 else 0.0
+
+
+class FrozenDownloadEntry(DownloadEntry):
+    """A DownloadEntry that reached a terminal status and must no longer change"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Download {self.id} is finished; cannot set {name!r}")
 
 
 class DownloadQueueManager:
@@ -41,18 +189,31 @@ class DownloadQueueManager:
         self.active_worker_threads = []
         self._worker_lock = threading.Lock()
         self._stop_event = threading.Event()
+        self._sched_cv = threading.Condition()  # wakes the scheduler when there is work to look at
+        self._sched_pending = False
+        # Flag sets are used without _queue_lock: single set operations are atomic under the GIL
         self._cancelled_jobs = set()
 
         # In-memory download queue storage
-        self._next_id = 1
-        self._queue_lock = threading.Lock()
-        self._active_downloads = {}  # id -> download_job dict
+        self._id_gen = count(1)  # next() on a count is atomic under the GIL
+        self._queue_lock = FastRLock()
+        self._active_downloads: Dict[int, DownloadEntry] = {}  # id -> DownloadEntry
+        self._queued_ids = deque()  # ids in submission order; stale ids are skipped when popped
         self._cancelled_episodes = set() # set of (queue_id, ep_url)
-        self._completed_downloads = []  # list of completed download jobs (keep last N)
+        self._completed_downloads = OrderedDict()  # queue_id -> finished job, oldest first (keep last N)
         self._max_completed_history = 10
+        self._status_cache = None  # last get_queue_status() result
+        self._status_dirty = True  # set whenever a job field shown in the status changes
+        # Reference pair for turning monotonic job timestamps into wall-clock times
+        self._epoch_wall, self._epoch_mono = datetime.now(), time.monotonic()
         self._skip_flags = set()
         self._tracker_scan_status = {} # tracker_id -> bool (is_scanning)
-        self._tracker_debug_messages = {} # tracker_id -> list of strings
+        self._tracker_debug_messages = {} # tracker_id -> deque of the latest debug strings
+        self._host_sems = {} # host -> semaphore bounding concurrent tracker requests
+        # Keep-alive connections shared by all tracker scans
+        self._http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._http_session.mount("https://", adapter); self._http_session.mount("http://", adapter)
 
     def set_download_limits(self, series_count: int, episode_count: int):
         """Update the maximum number of concurrent series and episodes"""
@@ -62,7 +223,19 @@ class DownloadQueueManager:
             if self.db:
                 self.db.set_setting("max_concurrent_series", str(self.max_concurrent_series))
                 self.db.set_setting("max_concurrent_episodes", str(self.max_concurrent_episodes))
-            logging.info(f"Limits set: max_concurrent_series={self.max_concurrent_series}, max_concurrent_episodes={self.max_concurrent_episodes}")
+            logger.info("Limits set: max_concurrent_series=%s, max_concurrent_episodes=%s", self.max_concurrent_series, self.max_concurrent_episodes)
+        self._wake_scheduler()
+
+    def _wake_scheduler(self):
+        """Tell the scheduler to re-check the queue and free worker slots"""
+        with self._sched_cv:
+            self._sched_pending = True
+            self._sched_cv.notify_all()
+
+    def _wait_for_scheduler_work(self, timeout: float = 30):
+        with self._sched_cv:
+            if not self._sched_pending: self._sched_cv.wait(timeout=timeout)
+            self._sched_pending = False
 
     def start_queue_processor(self):
         """Start the background queue processor"""
@@ -74,13 +247,14 @@ class DownloadQueueManager:
                 target=self._queue_scheduler, daemon=True
             )
             self.scheduler_thread.start()
-            logging.info("Download queue processor started")
+            logger.info("Download queue processor started")
 
     def stop_queue_processor(self):
         """Stop the background queue processor"""
         if self.is_processing:
             self.is_processing = False
             self._stop_event.set()
+            self._wake_scheduler()
             if hasattr(self, "scheduler_thread"):
                 self.scheduler_thread.join(timeout=5)
             
@@ -90,7 +264,7 @@ class DownloadQueueManager:
                     thread.join(timeout=2)
                 self.active_worker_threads = []
                 
-            logging.info("Download queue processor stopped")
+            logger.info("Download queue processor stopped")
 
     def start_tracker_processor(self):
         """Start the background tracker processor"""
@@ -99,11 +273,11 @@ class DownloadQueueManager:
                 target=self._process_trackers, daemon=True
             )
             self.tracker_thread.start()
-            logging.info("Tracker processor started")
+            logger.info("Tracker processor started")
 
     def trigger_tracker_scan(self):
         """Manually trigger a tracker scan immediately"""
-        logging.info("Manual tracker scan triggered")
+        logger.info("Manual tracker scan triggered")
         threading.Thread(target=self._run_single_scan, daemon=True).start()
         return True
 
@@ -112,17 +286,11 @@ class DownloadQueueManager:
         try:
             if self.db:
                 trackers = self.db.get_trackers()
-                logging.info(f"Starting manual scan of {len(trackers)} trackers")
-                for tracker in trackers:
-                    self._tracker_scan_status[tracker["id"]] = True
-                    try:
-                        self._check_single_tracker(tracker)
-                    finally:
-                        self._tracker_scan_status[tracker["id"]] = False
-                    time.sleep(0.5) # Fast scan
-                logging.info("Manual tracker scan completed")
+                logger.info("Starting manual scan of %s trackers", len(trackers))
+                self._scan_trackers(trackers)
+                logger.info("Manual tracker scan completed")
         except Exception as e:
-            logging.error(f"Error in manual tracker scan: {e}")
+            logger.error("Error in manual tracker scan: %s", e)
 
     def _process_trackers(self):
         """Background worker that checks trackers for new episodes"""
@@ -130,11 +298,10 @@ class DownloadQueueManager:
             try:
                 if self.db:
                     trackers = self.db.get_trackers()
-                    for tracker in trackers:
-                        self._check_single_tracker(tracker)
-                        time.sleep(5)  # Pause between trackers to be polite
+                    self._sweep_tracker_state(trackers)
+                    self._scan_trackers(trackers)
             except Exception as e:
-                logging.error(f"Error in tracker processor: {e}")
+                logger.error("Error in tracker processor: %s", e)
 
             # Wait for 1 hour before next check
             for _ in range(3600):
@@ -142,17 +309,45 @@ class DownloadQueueManager:
                     return
                 time.sleep(1)
 
+    def _sweep_tracker_state(self, trackers):
+        """Forget scan state and debug messages of trackers that were deleted"""
+        live = {t["id"] for t in trackers}
+        for state in (self._tracker_debug_messages, self._tracker_scan_status):
+            for t_id in list(state):
+                if t_id not in live: state.pop(t_id, None)
+
+    def _scan_trackers(self, trackers):
+        """Check trackers concurrently; politeness is kept per host by _host_sem instead of sleeping between trackers"""
+        if not trackers: return
+
+        def scan(tracker):
+            self._tracker_scan_status[tracker["id"]] = True
+            try:
+                self._check_single_tracker(tracker)
+            finally:
+                self._tracker_scan_status[tracker["id"]] = False
+
+        with ThreadPoolExecutor(max_workers=min(_TRACKER_SCAN_WORKERS, len(trackers)), thread_name_prefix="tracker") as pool:
+            list(pool.map(scan, trackers))
+
+    def _host_sem(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc or url
+        return self._host_sems.setdefault(host, threading.BoundedSemaphore(_MAX_REQUESTS_PER_HOST))
+
     def _check_single_tracker(self, tracker):
         """Check a single tracker for new episodes"""
         tracker_id = tracker["id"]
-        self._tracker_debug_messages[tracker_id] = []
+        self._tracker_debug_messages[tracker_id] = deque(maxlen=_MAX_TRACKER_DEBUG_MESSAGES)
         
         def debug(msg, is_error=False):
             prefix = "ERROR: " if is_error else ""
             full_msg = f"[{tracker['anime_title']}] {prefix}{msg}"
-            self._tracker_debug_messages[tracker_id].append(full_msg)
-            if is_error: logging.error(full_msg)
-            else: logging.info(full_msg)
+            # The web UI pops the deque when it sends the messages, so a scan may need a fresh one
+            messages = self._tracker_debug_messages.get(tracker_id)
+            if messages is None: messages = self._tracker_debug_messages.setdefault(tracker_id, deque(maxlen=_MAX_TRACKER_DEBUG_MESSAGES))
+            messages.append(full_msg)
+            if is_error: logger.error(full_msg)
+            else: logger.info(full_msg)
 
         try:
             from ..common import get_season_episodes_details
@@ -171,6 +366,10 @@ class DownloadQueueManager:
                 "Language ID 1": 1, "Language ID 2": 2, "Language ID 3": 3,
             }
             target_lang_id = lang_map.get(target_language)
+            t_norm = target_language.lower()
+            lang_exact, lang_substr = {t_norm}, ()
+            for triggers, exact, substr in _LANG_MATCHERS:
+                if any(t in t_norm for t in triggers): lang_exact |= exact; lang_substr = substr; break
 
             if "/anime/stream/" in series_url:
                 slug = series_url.split("/anime/stream/")[-1].rstrip("/")
@@ -190,67 +389,67 @@ class DownloadQueueManager:
                 return
 
             debug(f"Fetching series details for slug: {slug}")
-            all_seasons_details = get_season_episodes_details(slug, base_url)
+            with self._host_sem(base_url):
+                all_seasons_details = get_season_episodes_details(slug, base_url, session=self._http_session)
             if not all_seasons_details:
                 debug("No seasons found or failed to fetch details", is_error=True)
                 return
 
             debug(f"Found {len(all_seasons_details)} seasons")
-            new_episodes = []
             updated_s, updated_e = tracker["last_season"], tracker["last_episode"]
             sorted_seasons = sorted(all_seasons_details.keys())
 
-            for s_num in sorted_seasons:
-                if s_num < tracker["last_season"]: continue
+            # Seasons and each season's episodes are sorted, so everything up to the last seen episode is skipped by bisection
+            candidates = []  # (season, episode, url, available according to the season index)
+            for s_num in sorted_seasons[bisect_left(sorted_seasons, last_season):]:
                 episodes = all_seasons_details[s_num]
                 debug(f"Checking Season {s_num} ({len(episodes)} episodes)")
-                for ep_detail in episodes:
+                ep_start = bisect_right([ep["episode"] for ep in episodes], last_episode) if s_num == last_season else 0
+                for ep_detail in episodes[ep_start:]:
                     e_num = ep_detail["episode"]
-                    if s_num == tracker["last_season"] and e_num <= tracker["last_episode"]: continue
                     available_langs = ep_detail.get("languages", [])
-                    is_available = False
-                    for l in available_langs:
-                        if (isinstance(l, int) and l == target_lang_id) or \
-                           (isinstance(l, str) and (l == target_language or "DE Dub" in l or "DE Sub" in l)):
-                            is_available = True
-                            break
-                    if not is_available:
-                        try:
-                            from ..models import Episode
-                            ep_url = f"{base_url}/{stream_path}/{slug}/staffel-{s_num}/episode-{e_num}"
-                                
-                            debug(f"Verifying S{s_num}E{e_num} via episode page...")
-                            temp_ep = Episode(link=ep_url); temp_ep.auto_fill_details()
-                            verified_langs = temp_ep.language_name
-                            
-                            debug(f"S{s_num}E{e_num}: Verified languages: {verified_langs}")
-                            for l in verified_langs:
-                                l_norm, t_norm = l.lower(), target_language.lower()
-                                if l == target_language or l_norm == t_norm: is_available = True; break
-                                if "german dub" in t_norm or "de dub" in t_norm or "deutsch" in t_norm:
-                                    if "de dub" in l_norm or "german dub" in l_norm or "synchronisation" in l_norm or l_norm == "deutsch" or l_norm == "de": is_available = True; break
-                                elif "german sub" in t_norm or "de sub" in t_norm:
-                                    if "de sub" in l_norm or "german sub" in l_norm or "untertitel" in l_norm: is_available = True; break
-                                elif "english sub" in t_norm or "en sub" in t_norm:
-                                    if "en sub" in l_norm or "english sub" in l_norm or l_norm == "englisch" or l_norm == "en": is_available = True; break
-                                elif "english dub" in t_norm or "en dub" in t_norm:
-                                    if "en dub" in l_norm or "english dub" in l_norm or l_norm == "englisch" or l_norm == "en": is_available = True; break
-                            
-                            if is_available:
-                                # Also verify provider availability
-                                verified_providers = [p.lower() for p in temp_ep.provider_name]
-                                debug(f"S{s_num}E{e_num}: Verified providers: {verified_providers}")
-                                if tracker["provider"].lower() not in verified_providers and "auto" not in tracker["provider"].lower():
-                                    debug(f"S{s_num}E{e_num}: Required provider {tracker['provider']} not found in {verified_providers}")
-                                    is_available = False
-                        except Exception as e:
-                            debug(f"S{s_num}E{e_num}: Failed to verify: {e}", is_error=True)
-                    if not is_available: continue
-                    debug(f"FOUND NEW EPISODE: S{s_num} E{e_num}")
-                    ep_url = f"{base_url}/{stream_path}/{slug}/staffel-{s_num}/episode-{e_num}"
-                    new_episodes.append(ep_url)
-                    if s_num > updated_s or (s_num == updated_s and e_num > updated_e):
-                        updated_s, updated_e = s_num, e_num
+                    str_langs = {l for l in available_langs if isinstance(l, str)}
+                    is_available = target_lang_id in available_langs or target_language in str_langs or any("DE Dub" in l or "DE Sub" in l for l in str_langs)
+                    candidates.append((s_num, e_num, _ep_url(base_url, stream_path, slug, s_num, e_num), is_available))
+
+            def verify(candidate):
+                """Check an episode against its own page when the season index does not list the language"""
+                s_num, e_num, ep_url, _ = candidate
+                try:
+                    from ..models import Episode
+                    debug(f"Verifying S{s_num}E{e_num} via episode page...")
+                    temp_ep = Episode(link=ep_url)
+                    with self._host_sem(ep_url): temp_ep.auto_fill_details(session=self._http_session)
+                    verified_langs = temp_ep.language_name
+                    
+                    debug(f"S{s_num}E{e_num}: Verified languages: {verified_langs}")
+                    if not any(l.lower() in lang_exact or any(m in l.lower() for m in lang_substr) for l in verified_langs): return False
+
+                    # Also verify provider availability
+                    verified_providers = [p.lower() for p in temp_ep.provider_name]
+                    debug(f"S{s_num}E{e_num}: Verified providers: {verified_providers}")
+                    if tracker["provider"].lower() not in verified_providers and "auto" not in tracker["provider"].lower():
+                        debug(f"S{s_num}E{e_num}: Required provider {tracker['provider']} not found in {verified_providers}")
+                        return False
+                    return True
+                except Exception as e:
+                    debug(f"S{s_num}E{e_num}: Failed to verify: {e}", is_error=True)
+                    return False
+
+            # Episode pages are fetched in parallel; _host_sem still caps the requests per host
+            to_verify = [c for c in candidates if not c[3]]
+            verified = set()
+            if to_verify:
+                with ThreadPoolExecutor(max_workers=min(_VERIFY_WORKERS, len(to_verify)), thread_name_prefix="verify") as pool:
+                    verified = {c[2] for c, ok in zip(to_verify, pool.map(verify, to_verify)) if ok}
+
+            new_episodes = []
+            for s_num, e_num, ep_url, is_available in candidates:
+                if not is_available and ep_url not in verified: continue
+                debug(f"FOUND NEW EPISODE: S{s_num} E{e_num}")
+                new_episodes.append(ep_url)
+                # Candidates are in ascending order, so the last hit is the newest
+                updated_s, updated_e = s_num, e_num
             if new_episodes:
                 self.add_download(anime_title=tracker["anime_title"], episode_urls=new_episodes, language=tracker["language"], provider=tracker["provider"], total_episodes=len(new_episodes), created_by=tracker["user_id"])
                 self.db.update_tracker_last_episode(tracker["id"], updated_s, updated_e)
@@ -261,56 +460,89 @@ class DownloadQueueManager:
         with self._queue_lock:
             if queue_id in self._active_downloads:
                 job = self._active_downloads[queue_id]
-                if job["status"] in ["queued", "downloading"]:
+                if job.status in (STATUS_QUEUED, STATUS_DOWNLOADING):
                     self._cancelled_jobs.add(queue_id)
-                    if job["status"] == "queued": self._update_download_status(queue_id, "failed", error_message="Cancelled by user")
+                    if job.status == STATUS_QUEUED: self._set_status(queue_id, STATUS_FAILED, error_message="Cancelled by user")
+                    self._wake_scheduler()
                     return True
             return False
 
     def skip_current_candidate(self, queue_id: int) -> bool:
-        with self._queue_lock:
-            if queue_id in self._active_downloads and self._active_downloads[queue_id]["status"] == "downloading":
-                self._skip_flags.add(queue_id); return True
-            return False
+        job = self._active_downloads.get(queue_id)
+        if job is not None and job.status == STATUS_DOWNLOADING:
+            self._skip_flags.add(queue_id); return True
+        return False
 
     def delete_download(self, queue_id: int) -> bool:
         with self._queue_lock:
-            for i, d in enumerate(self._completed_downloads):
-                if d["id"] == queue_id: self._completed_downloads.pop(i); return True
-            if queue_id in self._active_downloads and self._active_downloads[queue_id]["status"] != "downloading":
-                del self._active_downloads[queue_id]; return True
+            d = self._completed_downloads.pop(queue_id, None)
+            if d is not None: self._status_dirty = True; return True
+            if queue_id in self._active_downloads and self._active_downloads[queue_id].status != STATUS_DOWNLOADING:
+                del self._active_downloads[queue_id]; self._status_dirty = True; return True
             return False
 
     def add_download(self, anime_title: str, episode_urls: list, language: str, provider: str, total_episodes: int, created_by: int = None, episodes_config: dict = None) -> int:
         is_movie = any(url.startswith("movie4k:") or "/filme/" in url for url in episode_urls)
         episodes = []
         for url in episode_urls:
-            ep_name = url.split("/")[-1]
-            if "staffel-" in url and "episode-" in url:
-                try:
-                    parts = url.split("/")
-                    s_num = next(p.split("-")[1] for p in parts if "staffel-" in p)
-                    e_num = next(p.split("-")[1] for p in parts if "episode-" in p)
-                    ep_name = f"S{s_num} E{e_num}"
-                except: pass
-            episodes.append({"url": url, "name": ep_name, "status": "queued", "progress": 0.0, "speed": "", "eta": ""})
+            m = _SEASON_EP_RE.search(url)
+            ep_name = f"S{m.group(1)} E{m.group(2)}" if m else url.rsplit("/", 1)[-1]
+            episodes.append(EpisodeState(url, ep_name))
+        queue_id = next(self._id_gen)
         with self._queue_lock:
-            queue_id = self._next_id; self._next_id += 1
-            job = {"id": queue_id, "anime_title": anime_title, "episode_urls": episode_urls, "episodes": episodes, "language": language, "provider": provider, "is_movie": is_movie, "episodes_config": episodes_config, "total_episodes": total_episodes, "completed_episodes": 0, "status": "queued", "current_episode": "", "progress_percentage": 0.0, "current_episode_progress": 0.0, "error_message": "", "created_by": created_by, "created_at": datetime.now(), "started_at": None, "completed_at": None}
+            job = DownloadEntry(queue_id, anime_title, episode_urls, episodes, language, provider, is_movie=is_movie, episodes_config=episodes_config, total_episodes=total_episodes, created_by=created_by)
             self._active_downloads[queue_id] = job
+            self._queued_ids.append(queue_id)
+            self._status_dirty = True
         if not self.is_processing: self.start_queue_processor()
+        else: self._wake_scheduler()
         return queue_id
 
+    def _get_job(self, queue_id: int) -> Optional[DownloadEntry]:
+        return self._active_downloads.get(queue_id)  # a single dict lookup is atomic, no lock needed
+
+    @contextmanager
+    def _locked_job(self, queue_id: int, job: Optional[DownloadEntry] = None):
+        """Yield the active job with its own lock held, or None once it is gone or finished.
+        A job passed in by a caller that already holds it is yielded only while it is still the active entry."""
+        if job is None: job = self._get_job(queue_id)
+        if job is None:
+            yield None
+            return
+        with job.lock:
+            # Finished or deleted jobs are no longer the active entry for their id
+            yield job if self._active_downloads.get(queue_id) is job else None
+
+    def _wall_time(self, mono: float) -> datetime:
+        """Convert a time.monotonic() timestamp into a wall-clock datetime"""
+        return self._epoch_wall + timedelta(seconds=mono - self._epoch_mono)
+
     def get_queue_status(self):
+        """Return the queue status, rebuilt only if a job changed since the last call"""
+        if not self._status_dirty and self._status_cache is not None: return self._status_cache  # lock-free fast path
+        # Rebuilds are serialized so a slower poller can never store an older snapshot over a newer one;
+        # a writer racing the snapshot sets the flag again after its change, so the next poll picks it up
         with self._queue_lock:
-            active = []
-            for d in self._active_downloads.values():
-                if d["status"] in ["queued", "downloading"]:
-                    active.append({"id": d["id"], "anime_title": d["anime_title"], "total_episodes": d["total_episodes"], "completed_episodes": d["completed_episodes"], "status": d["status"], "is_movie": d.get("is_movie", False), "current_episode": d["current_episode"], "progress_percentage": float(round(d["progress_percentage"], 2)), "current_episode_progress": float(round(d["current_episode_progress"], 2)), "error_message": d["error_message"], "created_at": d["created_at"].isoformat() if d["created_at"] else None})
-            completed = []
-            for d in sorted(self._completed_downloads, key=lambda x: x.get("completed_at", datetime.min), reverse=True)[:5]:
-                completed.append({"id": d["id"], "anime_title": d["anime_title"], "total_episodes": d["total_episodes"], "completed_episodes": d["completed_episodes"], "status": d["status"], "is_movie": d.get("is_movie", False), "current_episode": d["current_episode"], "progress_percentage": d["progress_percentage"], "current_episode_progress": d.get("current_episode_progress", 100.0), "error_message": d["error_message"], "completed_at": d["completed_at"].isoformat() if d["completed_at"] else None})
-            return {"active": active, "completed": completed}
+            if not self._status_dirty and self._status_cache is not None: return self._status_cache
+            self._status_dirty = False
+            return self._build_queue_status()
+
+    def _build_queue_status(self):
+        """Caller holds _queue_lock"""
+        active_jobs = list(self._active_downloads.values())
+        completed_jobs = list(self._completed_downloads.values())[:-6:-1]  # newest first
+        active = []
+        for d in active_jobs:
+            # Copy the raw fields under the job lock; rounding and isoformat happen after releasing it
+            with d.lock:
+                status, completed_eps, total_eps, current, progress, ep_progress, error = d.status, d.completed_episodes, d.total_episodes, d.current_episode, d.progress_percentage, d.current_episode_progress, d.error_message
+            if status in (STATUS_QUEUED, STATUS_DOWNLOADING):
+                active.append({"id": d.id, "anime_title": d.anime_title, "total_episodes": total_eps, "completed_episodes": completed_eps, "status": status, "is_movie": d.is_movie, "current_episode": current, "progress_percentage": round(progress, 2), "current_episode_progress": round(ep_progress, 2), "error_message": error, "created_at": self._wall_time(d.created_at).isoformat()})
+        completed = []
+        for d in completed_jobs:  # finished entries are frozen, no lock needed
+            completed.append({"id": d.id, "anime_title": d.anime_title, "total_episodes": d.total_episodes, "completed_episodes": d.completed_episodes, "status": d.status, "is_movie": d.is_movie, "current_episode": d.current_episode, "progress_percentage": d.progress_percentage, "current_episode_progress": d.current_episode_progress, "error_message": d.error_message, "completed_at": self._wall_time(d.completed_at).isoformat() if d.completed_at else None})
+        self._status_cache = {"active": active, "completed": completed}
+        return self._status_cache
 
     def _queue_scheduler(self):
         """Main scheduler that manages worker threads"""
@@ -326,7 +558,7 @@ class DownloadQueueManager:
                     if job:
                         # Mark job as starting so it's not picked up again immediately
                         # We use 'downloading' but with a special message
-                        self._update_download_status(job["id"], "downloading", current_episode="Initializing...")
+                        self._update_download_status(job.id, STATUS_DOWNLOADING, current_episode="Initializing...")
                         
                         worker = threading.Thread(
                             target=self._worker_wrapper, args=(job,), daemon=True
@@ -334,13 +566,13 @@ class DownloadQueueManager:
                         with self._worker_lock:
                             self.active_worker_threads.append(worker)
                         worker.start()
-                        logging.info(f"Started worker for job {job['id']}. Active workers: {len(self.active_worker_threads)}")
+                        logger.info("Started worker for job %s. Active workers: %s", job.id, len(self.active_worker_threads))
                     else:
-                        time.sleep(2)
+                        self._wait_for_scheduler_work()
                 else:
-                    time.sleep(2)
+                    self._wait_for_scheduler_work()
             except Exception as e:
-                logging.error(f"Scheduler error: {e}")
+                logger.error("Scheduler error: %s", e)
                 time.sleep(5)
 
     def _worker_wrapper(self, job):
@@ -348,15 +580,17 @@ class DownloadQueueManager:
         try:
             self._process_download_job(job)
         except KeyboardInterrupt:
-            self._update_download_status(job["id"], "failed", error_message="Interrupted")
+            self._update_download_status(job.id, STATUS_FAILED, error_message="Interrupted")
         except Exception as e:
-            logging.error(f"Worker error for job {job['id']}: {e}")
-            self._update_download_status(job["id"], "failed", error_message=f"Worker Error: {e}")
+            logger.error("Worker error for job %s: %s", job.id, e)
+            self._update_download_status(job.id, STATUS_FAILED, error_message=f"Worker Error: {e}")
+        finally:
+            self._wake_scheduler()
 
     def _process_download_job(self, job):
-        queue_id = job["id"]
+        queue_id = job.id
         try:
-            self._update_download_status(queue_id, "downloading", current_episode="Starting...")
+            self._update_download_status(queue_id, STATUS_DOWNLOADING, current_episode="Starting...")
             from ..entry import _group_episodes_by_series
             from ..models import Anime
             from pathlib import Path
@@ -364,17 +598,15 @@ class DownloadQueueManager:
             from .. import config
             import os
 
-            anime_list = _group_episodes_by_series(job["episode_urls"])
-            if not anime_list: self._update_download_status(queue_id, "failed", error_message="URL processing failed"); return
+            anime_list = _group_episodes_by_series(job.episode_urls)
+            if not anime_list: self._update_download_status(queue_id, STATUS_FAILED, error_message="URL processing failed"); return
             
             for a in anime_list:
-                a.language, a.provider, a.action = job["language"], job["provider"], "Download"
+                a.language, a.provider, a.action = job.language, job.provider, "Download"
             
             actual_total = sum(len(a.episode_list) for a in anime_list)
-            if actual_total != job["total_episodes"]: self._update_download_status(queue_id, "downloading", total_episodes=actual_total)
+            if actual_total != job.total_episodes: self._update_download_status(queue_id, STATUS_DOWNLOADING, total_episodes=actual_total)
 
-            from ..parser import arguments
-            
             # Base download directories
             series_download_dir = str(getattr(config, "DEFAULT_SERIES_PATH", os.path.expanduser("~/Downloads")))
             movie_download_dir = str(getattr(config, "DEFAULT_MOVIE_PATH", os.path.expanduser("~/Downloads")))
@@ -389,108 +621,76 @@ class DownloadQueueManager:
                 if custom_movie_path: movie_download_dir = custom_movie_path
                 elif custom_general_path: movie_download_dir = custom_general_path
 
-            download_dir = movie_download_dir if job.get("is_movie", False) else series_download_dir
+            download_dir = movie_download_dir if job.is_movie else series_download_dir
 
             # Episode processing with internal parallelism
-            active_ep_threads = []
             ep_lock = threading.Lock()
             completed_episodes_count = 0
             failed_episodes_count = 0
             
-            all_episodes_to_download = []
-            for anime in anime_list:
-                for episode in anime.episode_list:
-                    all_episodes_to_download.append((anime, episode))
-
-            ep_iterator = iter(all_episodes_to_download)
-            stop_job = False
-
-            while not stop_job:
-                # Clean up finished threads
-                active_ep_threads = [t for t in active_ep_threads if t.is_alive()]
-                
-                if self._stop_event.is_set() or queue_id in self._cancelled_jobs:
-                    stop_job = True
-                    break
-
-                if len(active_ep_threads) < self.max_concurrent_episodes:
-                    try:
-                        anime, episode = next(ep_iterator)
-                        
-                        original_link = episode.link
-                        
-                        # Handle Movie4k separately as before
-                        if original_link.startswith("movie4k:"):
-                            # For simplicity and to avoid complex state tracking, Movie4k remains serial within its job for now 
-                            # or we could also spawn it. Let's keep it serial for now to avoid issues with its specific logic.
-                            if self._process_movie4k_download(queue_id, original_link, job, download_dir):
-                                with ep_lock: completed_episodes_count += 1
-                            else:
-                                with ep_lock: failed_episodes_count += 1
-                            continue
-
-                        is_cancelled = False
-                        with self._queue_lock:
-                            if queue_id in self._active_downloads:
-                                for ep_item in self._active_downloads[queue_id]["episodes"]:
-                                    if ep_item["url"] == original_link and ep_item["status"] == "cancelled": is_cancelled = True; break
-                        if is_cancelled: continue
-
-                        # Start episode download thread
-                        t = threading.Thread(
-                            target=self._download_single_episode,
-                            args=(queue_id, anime, episode, job, download_dir, ep_lock),
-                            daemon=True
-                        )
-                        active_ep_threads.append(t)
-                        t.start()
-                        
-                    except StopIteration:
-                        if not active_ep_threads:
-                            break
-                        time.sleep(0.5)
-                else:
-                    time.sleep(0.5)
+            # Sized for the whole job; threads are only spawned for submitted episodes, and submissions are
+            # gated on the current max_concurrent_episodes so set_download_limits applies to running jobs too
+            with ThreadPoolExecutor(max_workers=max(1, sum(len(a.episode_list) for a in anime_list)), thread_name_prefix=f"job-{queue_id}") as pool:
+                pending = set()
+                for anime, episode in ((a, ep) for a in anime_list for ep in a.episode_list):
+                    while len(pending) >= self.max_concurrent_episodes and not (self._stop_event.is_set() or queue_id in self._cancelled_jobs):
+                        _, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                    if self._stop_event.is_set() or queue_id in self._cancelled_jobs: break
+                    original_link = episode.link
+                    # Handle Movie4k separately as before
+                    if original_link.startswith("movie4k:"):
+                        # For simplicity and to avoid complex state tracking, Movie4k remains serial within its job for now 
+                        # or we could also spawn it. Let's keep it serial for now to avoid issues with its specific logic.
+                        if self._process_movie4k_download(queue_id, original_link, job, download_dir):
+                            with ep_lock: completed_episodes_count += 1
+                        else:
+                            with ep_lock: failed_episodes_count += 1
+                        continue
+                    pending.add(pool.submit(self._download_single_episode, queue_id, anime, episode, job, download_dir))
 
-            # Wait for remaining episode threads
-            for t in active_ep_threads:
-                t.join()
+                while pending:
+                    if self._stop_event.is_set() or queue_id in self._cancelled_jobs:
+                        # Drop episodes that have not started yet; running ones stop via their progress callback
+                        for f in pending: f.cancel()
+                        break
+                    _, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
 
             if queue_id in self._cancelled_jobs:
-                self._update_download_status(queue_id, "failed", error_message="Cancelled by user")
-                with self._queue_lock: self._cancelled_jobs.discard(queue_id)
+                self._update_download_status(queue_id, STATUS_FAILED, error_message="Cancelled by user")
+                self._cancelled_jobs.discard(queue_id)
                 return
 
             # Final job status update
-            with self._queue_lock:
-                if queue_id in self._active_downloads:
-                    job_data = self._active_downloads[queue_id]
-                    successful = sum(1 for e in job_data["episodes"] if e["status"] == "completed")
-                    total_att = sum(1 for e in job_data["episodes"] if e["status"] in ["completed", "failed"])
-                    
-                    if successful == 0 and total_att > 0: status, msg = "failed", f"Failed: 0/{total_att} done."
-                    elif total_att < len(job_data["episodes"]): status, msg = "completed", f"Partial: {successful}/{len(job_data['episodes'])} done." # Should not happen if iterator finished
-                    else: status, msg = "completed", f"Done: {successful} eps."
-                    
-                    self._update_download_status(queue_id, status, completed_episodes=successful, current_episode=msg, error_message=msg if status=="failed" else None)
+            with self._locked_job(queue_id) as job_data:
+                if job_data:
+                    successful = sum(1 for e in job_data.episodes if e.status == STATUS_COMPLETED)
+                    total_att = sum(1 for e in job_data.episodes if e.status in (STATUS_COMPLETED, STATUS_FAILED))
+                    total_eps = len(job_data.episodes)
+            if job_data:
+                if successful == 0 and total_att > 0: status, msg = STATUS_FAILED, f"Failed: 0/{total_att} done."
+                elif total_att < total_eps: status, msg = STATUS_COMPLETED, f"Partial: {successful}/{total_eps} done." # Should not happen if iterator finished
+                else: status, msg = STATUS_COMPLETED, f"Done: {successful} eps."
+
+                self._update_download_status(queue_id, status, completed_episodes=successful, current_episode=msg, error_message=msg if status==STATUS_FAILED else None)
         except Exception as e: 
-            logging.error(f"Error in _process_download_job: {e}")
-            self._update_download_status(queue_id, "failed", error_message=f"Error: {e}")
+            logger.error("Error in _process_download_job: %s", e)
+            self._update_download_status(queue_id, STATUS_FAILED, error_message=f"Error: {e}")
 
-    def _download_single_episode(self, queue_id, anime, episode, job, download_dir, ep_lock):
+    def _download_single_episode(self, queue_id, anime, episode, job, download_dir):
         """Worker function for a single episode download within a job"""
         original_link = episode.link
         episode_info = f"{anime.title} - Episode {episode.episode} (Season {episode.season})"
         
         # Determine language and provider
-        ep_config = (job.get("episodes_config") or {}).get(original_link) or {}
-        lang = ep_config.get("language") or job["language"]
-        prov = ep_config.get("provider") or job["provider"]
+        ep_config = (job.episodes_config or {}).get(original_link) or {}
+        lang = ep_config.get("language") or job.language
+        prov = ep_config.get("provider") or job.provider
         
-        with self._queue_lock:
-            if queue_id in self._active_downloads:
-                for ep_item in self._active_downloads[queue_id]["episodes"]:
-                    if ep_item["url"] == original_link: ep_item["status"] = "downloading"
+        # Resolve this episode's state once; the callbacks below update it directly
+        with self._locked_job(queue_id, job) as job_ref:
+            ep_ref = job_ref.episodes_by_url.get(original_link) if job_ref else None
+            if ep_ref is None or ep_ref.status == STATUS_CANCELLED: return  # job finished or episode stopped while queued
+            ep_ref.status = STATUS_DOWNLOADING
 
         try:
             from ..models import Anime as AnimeModel
@@ -501,20 +701,21 @@ class DownloadQueueManager:
             
             temp_anime = AnimeModel(title=anime.title, slug=anime.slug, site=anime.site, language=lang, provider=prov, action=anime.action, episode_list=[temp_episode])
 
+            last_progress_ts = 0.0
+
             def web_progress_callback(d):
+                nonlocal last_progress_ts
                 if self._stop_event.is_set() or queue_id in self._cancelled_jobs: raise KeyboardInterrupt("Stopped")
-                with self._queue_lock:
-                    if (queue_id, original_link) in self._cancelled_episodes: 
-                        self._cancelled_episodes.discard((queue_id, original_link))
-                        raise KeyboardInterrupt("EpCancelled")
-                    if queue_id in self._skip_flags: 
-                        # This skips THE ENTIRE JOB in current implementation, 
-                        # but here it might only skip one episode if we are not careful.
-                        # For now, let's keep it per-episode skip.
-                        self._skip_flags.discard(queue_id)
-                        raise KeyboardInterrupt("Skip")
+                if _consume_flag(self._cancelled_episodes, (queue_id, original_link)): raise KeyboardInterrupt("EpCancelled")
+                # This skips THE ENTIRE JOB in current implementation, 
+                # but here it might only skip one episode if we are not careful.
+                # For now, let's keep it per-episode skip.
+                if _consume_flag(self._skip_flags, queue_id): raise KeyboardInterrupt("Skip")
 
                 if d["status"] == "downloading":
+                    now = time.monotonic()
+                    if now - last_progress_ts < _PROGRESS_INTERVAL: return
+                    last_progress_ts = now
                     p = 0.0
                     if d.get("_percent_str"):
                         try: p = float(d["_percent_str"].replace("%", ""))
@@ -523,185 +724,172 @@ class DownloadQueueManager:
                         db, tb = d.get("downloaded_bytes", 0), d.get("total_bytes") or d.get("total_bytes_estimate")
                         if tb: p = (db / tb) * 100
                     p = min(100.0, max(0.0, p))
-                    s, e = re.sub(r"\x1b\[[0-9;]*m", "", str(d.get("_speed_str", "N/A"))).strip(), re.sub(r"\x1b\[[0-9;]*m", "", str(d.get("_eta_str", "N/A"))).strip()
+                    s, e = _strip_ansi(str(d.get("_speed_str", "N/A"))).strip(), _strip_ansi(str(d.get("_eta_str", "N/A"))).strip()
                     
-                    with self._queue_lock:
-                        if queue_id in self._active_downloads:
-                            # Update global job status (last active episode's status is shown)
-                            msg = f"Downloading {episode_info} - {p:.1f}%"
-                            self._active_downloads[queue_id]["current_episode"] = msg
-                            
-                            for ep_item in self._active_downloads[queue_id]["episodes"]:
-                                if ep_item["url"] == original_link:
-                                    ep_item["status"], ep_item["progress"], ep_item["speed"], ep_item["eta"] = "downloading", p, s if s != "N/A" else "", e if e != "N/A" else ""
-                    
-                    self.update_episode_progress(queue_id, p) # This updates progress_percentage globally
+                    msg = f"Downloading {episode_info} - {p:.1f}%"
+                    with self._locked_job(queue_id, job) as job_ref:
+                        if job_ref:
+                            ep_ref.status, ep_ref.progress, ep_ref.speed, ep_ref.eta = STATUS_DOWNLOADING, p, s if s != "N/A" else "", e if e != "N/A" else ""
+                            # Update global job status (last active episode's status is shown) and progress_percentage
+                            self._set_episode_progress(job_ref, p, msg)
 
-            from ..action.download import download
             # Ensure output_dir is set correctly (yt-dlp uses a global state in arguments)
             # This might be a problem with multiple threads if they use different dirs...
             # But here all episodes of a job go to the same dir.
-            from ..parser import arguments
-            arguments.output_dir = download_dir
-            
-            success = download(temp_anime, web_progress_callback)
-
-            with self._queue_lock:
-                if queue_id in self._active_downloads:
-                    for ep_item in self._active_downloads[queue_id]["episodes"]:
-                        if ep_item["url"] == original_link:
-                            if success:
-                                ep_item["status"], ep_item["progress"] = "completed", 100.0
-                            else:
-                                ep_item["status"] = "failed"
+            _yt_arguments.output_dir = download_dir
             
-            if success:
-                # Update completed count
-                with self._queue_lock:
-                    if queue_id in self._active_downloads:
-                        self._active_downloads[queue_id]["completed_episodes"] += 1
+            success = _run_download(temp_anime, web_progress_callback)
+
+            with self._locked_job(queue_id, job) as job_ref:
+                if job_ref:
+                    if success: ep_ref.status, ep_ref.progress = STATUS_COMPLETED, 100.0
+                    else: ep_ref.status = STATUS_FAILED
+                    if success:
+                        # Update completed count
+                        job_ref.completed_episodes += 1
+                        self._status_dirty = True
 
         except KeyboardInterrupt as ki:
-            with self._queue_lock:
-                if queue_id in self._active_downloads:
-                    for ep_item in self._active_downloads[queue_id]["episodes"]:
-                        if ep_item["url"] == original_link:
-                            ep_item["status"] = "cancelled"
+            with self._locked_job(queue_id, job) as job_ref:
+                if job_ref: ep_ref.status = STATUS_CANCELLED
         except Exception as e:
-            logging.error(f"Error downloading episode {episode_info}: {e}")
-            with self._queue_lock:
-                if queue_id in self._active_downloads:
-                    for ep_item in self._active_downloads[queue_id]["episodes"]:
-                        if ep_item["url"] == original_link:
-                            ep_item["status"] = "failed"
-
-            if queue_id in self._cancelled_jobs:
-                self._update_download_status(queue_id, "failed", error_message="Cancelled by user")
-                with self._queue_lock: self._cancelled_jobs.discard(queue_id)
-                return
-            total_att = successful_downloads + failed_downloads
-            if successful_downloads == 0 and failed_downloads > 0: status, msg = "failed", f"Failed: 0/{failed_downloads} done."
-            elif failed_downloads > 0: status, msg = "completed", f"Partial: {successful_downloads}/{total_att} done."
-            else: status, msg = "completed", f"Done: {successful_downloads} eps."
-            self._update_download_status(queue_id, status, completed_episodes=successful_downloads, current_episode=msg, error_message=msg if status=="failed" else None)
-        except Exception as e: self._update_download_status(queue_id, "failed", error_message=f"Error: {e}")
+            # A single transition; cancelling the whole job is left to _process_download_job once its workers drain
+            with self._locked_job(queue_id, job) as job_ref:
+                if job_ref: ep_ref.status = STATUS_FAILED
+            logger.error("Error downloading episode %s: %s", episode_info, e)
 
     def _get_next_queued_download(self):
-        with self._queue_lock:
-            for d in self._active_downloads.values():
-                if d["status"] == "queued": return d
-            return None
-
-    def update_episode_progress(self, queue_id: int, episode_progress: float, current_episode_desc: str = None):
-        with self._queue_lock:
-            if queue_id not in self._active_downloads: return False
-            d = self._active_downloads[queue_id]
-            d["current_episode_progress"] = float(min(100.0, max(0.0, float(episode_progress))))
-            if current_episode_desc: d["current_episode"] = current_episode_desc
-            t, c = int(d.get("total_episodes", 1)), int(d.get("completed_episodes", 0))
-            if t > 0: d["progress_percentage"] = float(min(100.0, max(0.0, ((c + (d["current_episode_progress"]/100.0))/t)*100.0)))
-            return True
+        # Only the scheduler thread pops, and deque.popleft() is atomic, so no lock is needed
+        while self._queued_ids:
+            d = self._active_downloads.get(self._queued_ids.popleft())
+            if d is not None and d.status == STATUS_QUEUED: return d
+        return None
+
+    def update_episode_progress(self, queue_id: int, episode_progress: float, current_episode_desc: str = None) -> UpdateResult:
+        with self._locked_job(queue_id) as d:
+            if d is None: return UpdateResult.NOT_FOUND
+            self._set_episode_progress(d, episode_progress, current_episode_desc)
+            return UpdateResult.OK
+
+    def _set_episode_progress(self, d: DownloadEntry, episode_progress: float, current_episode_desc: str = None):
+        """Caller holds d.lock"""
+        d.current_episode_progress = min(100.0, max(0.0, float(episode_progress)))
+        if current_episode_desc: d.current_episode = current_episode_desc
+        if d._inv_total_x100: d.progress_percentage = min(100.0, (d.completed_episodes + d.current_episode_progress*0.01) * d._inv_total_x100)
+        self._status_dirty = True
 
     def stop_episode(self, queue_id: int, ep_url: str) -> bool:
         with self._queue_lock:
-            if queue_id not in self._active_downloads: return False
-            job = self._active_downloads[queue_id]
-            ep = next((e for e in job["episodes"] if e["url"] == ep_url), None)
-            if not ep: return False
-            if ep["status"] == "downloading": ep["status"] = "cancelled"; self._cancelled_episodes.add((queue_id, ep_url)); return True
-            if ep_url in job["episode_urls"]: job["episode_urls"].remove(ep_url)
-            job["episodes"] = [e for e in job["episodes"] if e["url"] != ep_url]; job["total_episodes"] = len(job["episodes"])
-            if not job["episodes"]: self.cancel_download(queue_id)
-            return True
+            job = self._active_downloads.get(queue_id)
+            if job is None: return False
+            with job.lock:
+                ep = job.episodes_by_url.get(ep_url)
+                if not ep: return False
+                if ep.status == STATUS_DOWNLOADING: ep.status = STATUS_CANCELLED; self._cancelled_episodes.add((queue_id, ep_url)); return True
+                if ep_url in job.episode_urls: job.episode_urls.remove(ep_url)
+                del job.episodes_by_url[ep_url]
+                job.episodes = [e for e in job.episodes if e.url != ep_url]; job.set_total_episodes(len(job.episodes)); self._status_dirty = True
+                emptied = not job.episodes
+        if emptied: self.cancel_download(queue_id)
+        return True
 
     def reorder_episodes(self, queue_id: int, new_order_urls: list) -> bool:
-        with self._queue_lock:
-            if queue_id not in self._active_downloads: return False
-            job = self._active_downloads[queue_id]
-            fixed = [e["url"] for e in job["episodes"] if e["status"] != "queued"]
-            if new_order_urls[:len(fixed)] != fixed or set(job["episode_urls"]) != set(new_order_urls): return False
-            job["episode_urls"] = new_order_urls
-            u_to_e = {e["url"]: e for e in job["episodes"]}; job["episodes"] = [u_to_e[u] for u in new_order_urls]
+        with self._locked_job(queue_id) as job:
+            if job is None: return False
+            if len(new_order_urls) != len(job.episodes): return False
+            fixed = [e.url for e in job.episodes if e.status != STATUS_QUEUED]
+            # Compared against the index keys view, so only one set is built; duplicates still fail the check
+            if new_order_urls[:len(fixed)] != fixed or job.episodes_by_url.keys() != set(new_order_urls): return False
+            job.episode_urls = new_order_urls
+            job.episodes = [job.episodes_by_url[u] for u in new_order_urls]
             return True
 
     def get_job_episodes(self, queue_id: int):
-        with self._queue_lock:
-            if queue_id in self._active_downloads: return self._active_downloads[queue_id].get("episodes", [])
-            for j in self._completed_downloads:
-                if j["id"] == queue_id: return j.get("episodes", [])
-            return None
+        j = self._active_downloads.get(queue_id)
+        if j is None:
+            # A finishing job is moved to the history under _queue_lock; looking there under it too never hits the gap
+            with self._queue_lock: j = self._completed_downloads.get(queue_id)
+            if j is None: return None
+        with j.lock:
+            return [e.to_dict() for e in j.episodes]
 
     def _process_movie4k_download(self, queue_id, original_link, job, download_dir):
         """Dedizierte Logik für Movie4k Downloads um den Serien-Code nicht zu beeinflussen"""
         from ..movie4k.movie4k_stream_finder import hole_sprachliste, hole_stream_daten, download_stream
         
-        logging.info(f"[DEBUG] Processing Movie4k download: ID={queue_id}, Link={original_link}")
+        logger.debug("Processing Movie4k download: ID=%s, Link=%s", queue_id, original_link)
         
+        with self._locked_job(queue_id, job) as job_ref:
+            ep_ref = job_ref.episodes_by_url.get(original_link) if job_ref else None
+
         try:
-            self._update_download_status(queue_id, "downloading", current_episode="Resolving Movie4k...")
+            self._update_download_status(queue_id, STATUS_DOWNLOADING, current_episode="Resolving Movie4k...")
             m_id = original_link.split(":")[1]
-            logging.info(f"[DEBUG] Extracted Movie4k ID: {m_id}")
+            logger.debug("Extracted Movie4k ID: %s", m_id)
             
             # 1. Sprachliste holen
             langs = hole_sprachliste(m_id)
-            logging.info(f"[DEBUG] Languages found: {len(langs) if langs else 0}")
+            logger.debug("Languages found: %s", len(langs) if langs else 0)
             if not langs:
-                logging.error(f"Movie4k: No languages found for {m_id}")
-                self._update_download_status(queue_id, "failed", error_message="No languages found on Movie4k")
+                logger.error("Movie4k: No languages found for %s", m_id)
+                self._update_download_status(queue_id, STATUS_FAILED, error_message="No languages found on Movie4k")
                 return False
 
             # 2. Beste Sprache wählen (hier einfach die erste, meist Deutsch)
             target_lang = langs[0]
-            logging.info(f"[DEBUG] Target language selected: {target_lang}")
+            logger.debug("Target language selected: %s", target_lang)
             s_data = hole_stream_daten(target_lang["_id"])
             streams = s_data.get("streams", []) if s_data else []
-            logging.info(f"[DEBUG] Streams found: {len(streams)}")
+            logger.debug("Streams found: %s", len(streams))
             
             if not streams:
-                logging.error(f"Movie4k: No streams found for {m_id}")
-                self._update_download_status(queue_id, "failed", error_message="No streams found for this language")
+                logger.error("Movie4k: No streams found for %s", m_id)
+                self._update_download_status(queue_id, STATUS_FAILED, error_message="No streams found for this language")
                 return False
 
-            # 3. Streams durchprobieren (von neu nach alt)
+            # 3. Streams durchprobieren (von neu nach alt), tote Hoster vorher per HEAD aussortieren
+            candidates = []
+            for s in reversed(streams):
+                u = s.get("stream", "")
+                if u: candidates.append(_normalize_scheme(u))
+            title = s_data.get("title", job.anime_title)
+            lang_code = s_data.get("lang", "de")
+            msg_prefix = f"Downloading {title} - "
+
             success = False
-            for i, s in enumerate(reversed(streams)):
+            for stream_url in self._probe_streams(candidates):
                 if self._stop_event.is_set() or queue_id in self._cancelled_jobs: break
                 
-                u = s.get("stream", "")
-                if not u: continue
-                
-                stream_url = "https:" + u if u.startswith("//") else u if u.startswith("http") else "https://" + u
-                
-                title = s_data.get("title", job["anime_title"])
-                lang_code = s_data.get("lang", "de")
-                
+                last_progress_ts = 0.0
+
                 def web_progress_callback(d):
+                    nonlocal last_progress_ts
                     if self._stop_event.is_set() or queue_id in self._cancelled_jobs: raise KeyboardInterrupt("Stopped")
                     
-                    with self._queue_lock:
-                        if queue_id in self._skip_flags:
-                            self._skip_flags.discard(queue_id)
-                            logging.info(f"[DEBUG] Skip requested for Movie4k job {queue_id}")
-                            raise KeyboardInterrupt("Skip")
+                    if _consume_flag(self._skip_flags, queue_id):
+                        logger.debug("Skip requested for Movie4k job %s", queue_id)
+                        raise KeyboardInterrupt("Skip")
 
                     if d["status"] == "downloading":
+                        now = time.monotonic()
+                        if now - last_progress_ts < _PROGRESS_INTERVAL: return
+                        last_progress_ts = now
                         p = 0.0
                         if d.get("_percent_str"):
                             try: p = float(d["_percent_str"].replace("%", ""))
                             except: pass
                         p = min(100.0, max(0.0, p))
-                        s_speed, e_eta = re.sub(r"\x1b\[[0-9;]*m", "", str(d.get("_speed_str", "N/A"))).strip(), re.sub(r"\x1b\[[0-9;]*m", "", str(d.get("_eta_str", "N/A"))).strip()
-                        msg = f"Downloading {title} - {p:.1f}% | Speed: {s_speed} | ETA: {e_eta}"
+                        s_speed, e_eta = _strip_ansi(str(d.get("_speed_str", "N/A"))).strip(), _strip_ansi(str(d.get("_eta_str", "N/A"))).strip()
+                        msg = f"{msg_prefix}{p:.1f}% | Speed: {s_speed} | ETA: {e_eta}"
                         
-                        with self._queue_lock:
-                            if queue_id in self._active_downloads:
-                                self._active_downloads[queue_id]["current_episode"], self._active_downloads[queue_id]["current_episode_progress"] = msg, float(p)
-                                for ep_item in self._active_downloads[queue_id]["episodes"]:
-                                    if ep_item["url"] == original_link:
-                                        ep_item["status"], ep_item["progress"], ep_item["speed"], ep_item["eta"] = "downloading", p, s_speed if s_speed != "N/A" else "", e_eta if e_eta != "N/A" else ""
+                        with self._locked_job(queue_id, job) as job_ref:
+                            if job_ref:
+                                job_ref.current_episode, job_ref.current_episode_progress = msg, p
+                                self._status_dirty = True
+                                if ep_ref: ep_ref.status, ep_ref.progress, ep_ref.speed, ep_ref.eta = STATUS_DOWNLOADING, p, s_speed if s_speed != "N/A" else "", e_eta if e_eta != "N/A" else ""
                 
                 # Download mit Movie4k-Engine starten
-                logging.info(f"[DEBUG] Starting download attempt for stream: {stream_url}")
+                logger.debug("Starting download attempt for stream: %s", stream_url)
                 try:
                     success = download_stream(
                         stream_url, 
@@ -710,58 +898,98 @@ class DownloadQueueManager:
                         web_progress_callback=web_progress_callback,
                         output_dir=download_dir
                     )
-                    logging.info(f"[DEBUG] Download success status: {success}")
+                    logger.debug("Download success status: %s", success)
                     
                     if success:
-                        completed = job.get("completed_episodes", 0) + 1
-                        with self._queue_lock:
-                            if queue_id in self._active_downloads:
-                                for ep_item in self._active_downloads[queue_id]["episodes"]:
-                                    if ep_item["url"] == original_link: ep_item["status"], ep_item["progress"] = "completed", 100.0
-                        self._update_download_status(queue_id, "downloading", completed_episodes=completed, current_episode=f"Completed {title}", current_episode_progress=100.0)
+                        completed = job.completed_episodes + 1
+                        with self._locked_job(queue_id, job) as job_ref:
+                            if job_ref and ep_ref: ep_ref.status, ep_ref.progress = STATUS_COMPLETED, 100.0
+                        self._update_download_status(queue_id, STATUS_DOWNLOADING, completed_episodes=completed, current_episode=f"Completed {title}", current_episode_progress=100.0)
                         return True
                 except KeyboardInterrupt as ki:
                     if str(ki) == "Skip":
-                        logging.info(f"[DEBUG] Skipping Movie4k stream as requested")
+                        logger.debug("Skipping Movie4k stream as requested")
                         continue
                     else:
                         raise ki
             
             if not success:
-                with self._queue_lock:
-                    if queue_id in self._active_downloads:
-                        for ep_item in self._active_downloads[queue_id]["episodes"]:
-                            if ep_item["url"] == original_link: ep_item["status"] = "failed"
+                with self._locked_job(queue_id, job) as job_ref:
+                    if job_ref and ep_ref: ep_ref.status = STATUS_FAILED
                 return False
 
         except Exception as e:
-            logging.error(f"Movie4k processing error: {e}")
+            logger.error("Movie4k processing error: %s", e)
             return False
 
-    def _update_download_status(self, queue_id: int, status: str, completed_episodes: int = None, current_episode: str = None, error_message: str = None, total_episodes: int = None, current_episode_progress: float = None):
-        with self._queue_lock:
-            if queue_id not in self._active_downloads: return False
-            d = self._active_downloads[queue_id]; d["status"] = status
-            if total_episodes is not None: d["total_episodes"] = total_episodes
-            if completed_episodes is not None: d["completed_episodes"] = completed_episodes
-            if current_episode_progress is not None: d["current_episode_progress"] = min(100.0, max(0.0, float(current_episode_progress)))
-            t, c, cp = d["total_episodes"], d["completed_episodes"], d.get("current_episode_progress", 0.0)
-            if t > 0: d["progress_percentage"] = float(min(100.0, ((int(c) + (float(cp)/100.0))/int(t))*100.0 if status == "downloading" else (int(c)/int(t))*100.0))
-            if current_episode is not None: d["current_episode"] = current_episode
-            if error_message is not None: d["error_message"] = error_message
-            if status == "downloading" and d["started_at"] is None: d["started_at"] = datetime.now()
-            elif status in ["completed", "failed"]:
-                d["completed_at"] = datetime.now()
-                if status == "completed": d["current_episode_progress"], d["progress_percentage"] = 100.0, 100.0
-                self._completed_downloads.append(d.copy())
-                if len(self._completed_downloads) > self._max_completed_history: self._completed_downloads = self._completed_downloads[-self._max_completed_history:]
-                del self._active_downloads[queue_id]
-            return True
-
-
-_download_manager = None
+    def _probe_streams(self, urls: list) -> list:
+        """HEAD all stream URLs in parallel and reorder them: live ones fastest first, then the rest in their original order.
+        Nothing is dropped, since some hosters reject HEAD but still serve the GET."""
+        if len(urls) < 2: return urls
 
+        def probe(url):
+            start = time.monotonic()
+            try:
+                r = self._http_session.head(url, headers=DEFAULT_HEADERS, allow_redirects=True, timeout=_STREAM_PROBE_TIMEOUT)
+                return time.monotonic() - start if r.status_code < 400 else None
+            except requests.RequestException:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(_STREAM_PROBE_WORKERS, len(urls)), thread_name_prefix="probe") as pool:
+            timings = list(pool.map(probe, urls))
+        alive = sorted((t, i) for i, t in enumerate(timings) if t is not None)
+        logger.debug("Movie4k stream probe: %s/%s alive", len(alive), len(urls))
+        return [urls[i] for _, i in alive] + [u for u, t in zip(urls, timings) if t is None]
+
+    def _update_download_status(self, queue_id: int, status: str, completed_episodes: int = None, current_episode: str = None, error_message: str = None, total_episodes: int = None, current_episode_progress: float = None) -> UpdateResult:
+        with self._queue_lock:
+            return self._set_status(queue_id, status, completed_episodes, current_episode, error_message, total_episodes, current_episode_progress)
+
+    def _set_status(self, queue_id: int, status: str, completed_episodes: int = None, current_episode: str = None, error_message: str = None, total_episodes: int = None, current_episode_progress: float = None) -> UpdateResult:
+        """Caller holds _queue_lock"""
+        status = sys.intern(status)
+        if status not in (STATUS_DOWNLOADING, STATUS_COMPLETED, STATUS_FAILED):
+            logger.warning("Rejected status %r for job %s", status, queue_id)
+            return UpdateResult.INVALID_TRANSITION
+        bucket = self._active_downloads
+        # Terminal transitions take the job out of the active set with the same lookup
+        d = bucket.get(queue_id) if status == STATUS_DOWNLOADING else bucket.pop(queue_id, None)
+        if d is None: return UpdateResult.NOT_FOUND
+        with d.lock:
+            if status == STATUS_DOWNLOADING: self._apply_progress(d, completed_episodes, current_episode, error_message, total_episodes, current_episode_progress)
+            else: self._finalize(d, status, completed_episodes, current_episode, error_message, total_episodes)
+        self._status_dirty = True  # only after the change, so a lock-free status read never caches a half-applied update
+        return UpdateResult.OK
+
+    def _apply_progress(self, d: DownloadEntry, completed_episodes, current_episode, error_message, total_episodes, current_episode_progress):
+        """Hot path of _update_download_status: progress of a running job. Caller holds _queue_lock and d.lock."""
+        d.status = STATUS_DOWNLOADING
+        if total_episodes is not None: d.set_total_episodes(total_episodes)
+        if completed_episodes is not None: d.completed_episodes = completed_episodes
+        if current_episode_progress is not None: d.current_episode_progress = min(100.0, max(0.0, float(current_episode_progress)))
+        if d._inv_total_x100: d.progress_percentage = min(100.0, (d.completed_episodes + d.current_episode_progress*0.01) * d._inv_total_x100)
+        if current_episode is not None: d.current_episode = current_episode
+        if error_message is not None: d.error_message = error_message
+        if d.started_at is None: d.started_at = time.monotonic()
+
+    def _finalize(self, d: DownloadEntry, status: str, completed_episodes, current_episode, error_message, total_episodes):
+        """Cold path of _update_download_status: archive a job already removed from _active_downloads. Caller holds _queue_lock and d.lock."""
+        d.status = status
+        if total_episodes is not None: d.set_total_episodes(total_episodes)
+        if completed_episodes is not None: d.completed_episodes = completed_episodes
+        if d._inv_total_x100: d.progress_percentage = min(100.0, d.completed_episodes * d._inv_total_x100)
+        if current_episode is not None: d.current_episode = current_episode
+        if error_message is not None: d.error_message = error_message
+        d.completed_at = time.monotonic()
+        if status == STATUS_COMPLETED: d.current_episode_progress, d.progress_percentage = 100.0, 100.0
+        # History only shows per-episode results; drop the scheduling inputs and transient transfer stats
+        d.episode_urls = d.episodes_by_url = d.episodes_config = None
+        for e in d.episodes: e.speed = e.eta = ""
+        d.__class__ = FrozenDownloadEntry  # shared with history, no copy needed
+        self._completed_downloads[d.id] = d
+        self._completed_downloads.move_to_end(d.id)
+        while len(self._completed_downloads) > self._max_completed_history: self._completed_downloads.popitem(last=False)
+
+@lru_cache(maxsize=1)
 def get_download_manager(database: Optional[UserDatabase] = None) -> DownloadQueueManager:
-    global _download_manager
-    if _download_manager is None: _download_manager = DownloadQueueManager(database)
-    return _download_manager
+    return DownloadQueueManager(database)